@@ -1,20 +1,26 @@
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from html import escape
 import importlib
+from itertools import chain
+from operator import itemgetter
+import time
 from typing import Callable
-import json
 
+import altair as alt
+import numpy as np
 import pandas as pd
 import requests
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from src.core.analytics import frequency_counter, overdue_gaps, recent_draw_summary, top_n
+from src.core.analytics import frequency_counter, most_overdue, overdue_gaps, recent_draw_summary, top_n
 from src.core.date_utils import format_uk_date
-from src.core.draws import draw_date_text, draw_to_payload, parse_optional_jackpot, prepare_draws
+from src.core.draws import DRAW_DATE_KEYS, draw_date_text, draw_to_payload, order_draws, parse_optional_jackpot
 from src.core.draw_dates import format_uk_draw_label, is_draw_day, next_draw_date, upcoming_draw_dates
 from src.core.ports import DrawsProvider, JackpotProvider, TicketStore
-from src.core.strategies import STRATEGIES, build_line, explain_line
+from src.core.strategies import STRATEGIES, build_lines, explain_lines
 from src.core.tickets import (
     as_iso_date,
     new_ticket,
@@ -23,10 +29,13 @@ from src.core.tickets import (
     ticket_from_dict,
     ticket_to_dict,
 )
-from src.services.draws_provider_http import HttpDrawsProvider
+from src.services.draws_provider_http import DRAWS_CACHE_PATH, HttpDrawsProvider
+from src.services.http_session import shared_session
 from src.services.jackpot_provider import LiveJackpotProvider
+from src.services.json_codec import encode_json_pretty
 from src.services.ticket_store_localstorage import LocalStorageTicketStore
 from src.ui_streamlit.css import inject_css
+from src.ui_streamlit.date_labels import uk_date_labels
 
 try:
     ui_components = importlib.import_module("src.ui_components")
@@ -106,13 +115,68 @@ def render_number_balls(
 
 st.set_page_config(page_title="Wilkos LuckyLogic", layout="wide")
 
-draws_provider: DrawsProvider = HttpDrawsProvider()
-jackpot_provider: JackpotProvider = LiveJackpotProvider()
+@st.cache_resource
+def _http_draws_provider() -> HttpDrawsProvider:
+    return HttpDrawsProvider(session=shared_session(), cache_path=DRAWS_CACHE_PATH)
+
+
+@st.cache_resource
+def _live_jackpot_provider() -> LiveJackpotProvider:
+    return LiveJackpotProvider()
+
+
+draws_provider: DrawsProvider = _http_draws_provider()
+jackpot_provider: JackpotProvider = _live_jackpot_provider()
 ticket_store: TicketStore = LocalStorageTicketStore()
 
-@st.cache_data(ttl=30 * 60)
+JACKPOT_TTL = 30 * 60
+DRAWS_TTL = 60 * 60
+
+
+@st.cache_resource
+def _cache_fill_times() -> dict[str, float]:
+    """Monotonic time each cached fetch last ran, shared by all sessions of this process."""
+    return {}
+
+
+def _cache_may_miss(name: str, ttl: float) -> bool:
+    filled_at = _cache_fill_times().get(name)
+    return filled_at is None or time.monotonic() - filled_at >= ttl
+
+
+@st.cache_data(ttl=JACKPOT_TTL)
 def cached_jackpot():
-    return jackpot_provider.get_jackpot()
+    meta = jackpot_provider.get_jackpot()
+    _cache_fill_times()["jackpot"] = time.monotonic()
+    return meta
+
+
+@st.cache_data(ttl=DRAWS_TTL, show_spinner=False)
+def cached_draws() -> list[dict]:
+    draws = [draw_to_payload(draw) for draw in order_draws(draws_provider.fetch_draws())]
+    _cache_fill_times()["draws"] = time.monotonic()
+    return draws
+
+
+def _draws_cache_key(draws: list[dict]) -> str:
+    """Cheap identity for a newest-first draw list (length and date span); its caches also expire with DRAWS_TTL."""
+    if not draws:
+        return "0"
+    return f"{len(draws)}:{draw_date_text(draws[0])}:{draw_date_text(draws[-1])}"
+
+
+@st.cache_data(ttl=DRAWS_TTL, max_entries=4, show_spinner=False)
+def _build_draws_df(draws_key: str, _draws: list[dict]) -> pd.DataFrame:
+    draws_df = pd.DataFrame(_draws)
+    if not draws_df.empty:
+        draw_date = pd.Series(pd.NA, index=draws_df.index, dtype="object")
+        for key in DRAW_DATE_KEYS:
+            if key in draws_df:
+                column = draws_df[key]
+                draw_date = draw_date.combine_first(column.where(column.notna() & (column != "")))
+        draws_df["draw_date"] = draw_date.fillna("").astype(str)
+        draws_df["draw_date_label"] = uk_date_labels(draws_df["draw_date"])
+    return draws_df.reset_index(drop=True)
 
 
 def _fallback_jackpot_from_draw(draw: dict | None) -> int | None:
@@ -121,6 +185,9 @@ def _fallback_jackpot_from_draw(draw: dict | None) -> int | None:
     return parse_optional_jackpot(draw)
 
 
+_EMPTY_SET: frozenset[int] = frozenset()
+
+
 def _render_ticket_match_row(row: dict) -> str:
     balls_markup = render_number_balls(
         row["main"],
@@ -147,6 +214,8 @@ def render_your_tickets_section(most_recent_draw: dict | None) -> None:
 
     recent_tickets = list(reversed(tickets[-3:]))
     last_result_date_iso = as_iso_date(draw_date_text(most_recent_draw or {}))
+    latest_mains = frozenset(value for value in (most_recent_draw or {}).get("numbers", []) if isinstance(value, int))
+    latest_stars = frozenset(value for value in (most_recent_draw or {}).get("stars", []) if isinstance(value, int))
 
     for ticket in recent_tickets:
         created_at = format_uk_date(ticket.get("created_at"))
@@ -158,8 +227,8 @@ def render_your_tickets_section(most_recent_draw: dict | None) -> None:
             continue
 
         draw_matches_latest = bool(last_result_date_iso and draw_date_iso == last_result_date_iso)
-        winning_mains = set(int(value) for value in (most_recent_draw or {}).get("numbers", []) if isinstance(value, int)) if draw_matches_latest else set()
-        winning_stars = set(int(value) for value in (most_recent_draw or {}).get("stars", []) if isinstance(value, int)) if draw_matches_latest else set()
+        winning_mains = latest_mains if draw_matches_latest else _EMPTY_SET
+        winning_stars = latest_stars if draw_matches_latest else _EMPTY_SET
 
         st.markdown(f"**{strategy}** · {draw_label} · Created {created_at}")
         pending_label = None if draw_matches_latest else f"Pending (Draw: {draw_label})"
@@ -177,6 +246,14 @@ def render_your_tickets_section(most_recent_draw: dict | None) -> None:
         _navigate_to("Tickets")
 
 
+def _ticket_lines_markup(lines: list) -> str:
+    """All lines of a saved ticket as one markdown block, so each ticket sends a single element."""
+    return "\n\n".join(
+        f"**Line {line_idx}**\n\n{render_number_balls(line.main, line.stars)}"
+        for line_idx, line in enumerate(lines, start=1)
+    )
+
+
 def _ensure_ticket_state() -> None:
     if "tickets" not in st.session_state:
         loaded_tickets = ticket_store.load()
@@ -191,6 +268,9 @@ def _ensure_ticket_state() -> None:
     if "page" not in st.session_state:
         st.session_state["page"] = "Picks"
 
+    if "tickets_rev" not in st.session_state:
+        st.session_state["tickets_rev"] = 0
+
 
 def _persist_tickets() -> None:
     tickets = []
@@ -199,13 +279,73 @@ def _persist_tickets() -> None:
         if ticket is not None:
             tickets.append(ticket)
     ticket_store.save(tickets)
+    st.session_state["tickets_rev"] = st.session_state.get("tickets_rev", 0) + 1
+
+
+def _tickets_export_payload() -> str:
+    """JSON export of the saved tickets, re-serialized only after tickets change."""
+    rev = st.session_state.get("tickets_rev", 0)
+    cached = st.session_state.get("tickets_export")
+    if cached is None or cached[0] != rev:
+        cached = (rev, encode_json_pretty(st.session_state["tickets"]))
+        st.session_state["tickets_export"] = cached
+    return cached[1]
 
 
 def _navigate_to(page_name: str) -> None:
     st.session_state["page"] = page_name
     st.rerun()
 
-def render_insights(draws_df: pd.DataFrame) -> None:
+@st.cache_resource(show_spinner=False)
+def _frequency_chart(top_numbers: tuple[tuple[int, int], ...]) -> alt.Chart:
+    numbers, counts = zip(*top_numbers)
+    freq_df = pd.DataFrame(
+        {
+            "number": pd.Series(numbers, dtype="int16"),
+            "count": pd.Series(counts, dtype="int32"),
+        }
+    )
+    return (
+        alt.Chart(freq_df)
+        .mark_bar()
+        .encode(
+            x=alt.X("count:Q", title="count"),
+            y=alt.Y("number:O", sort="-x", title="number"),
+        )
+    )
+
+
+@st.cache_data(ttl=DRAWS_TTL, max_entries=4, show_spinner=False)
+def _main_number_arrays(draws_key: str, _draws_df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Flatten in-range main numbers of the whole history into (int8 values, row index) arrays."""
+    number_lists = [values if isinstance(values, list) else [] for values in _draws_df["numbers"]] if "numbers" in _draws_df else []
+    lengths = np.fromiter((len(values) for values in number_lists), dtype=np.int64, count=len(number_lists))
+    flat = np.fromiter(chain.from_iterable(number_lists), dtype=np.int64, count=int(lengths.sum()))
+    row_idx = np.repeat(np.arange(len(number_lists), dtype=np.int32), lengths)
+
+    in_range = (flat >= 1) & (flat <= 50)
+    return flat[in_range].astype(np.int8), row_idx[in_range]
+
+
+def _overdue_table(filtered_df: pd.DataFrame, flat: np.ndarray, row_idx: np.ndarray) -> pd.DataFrame:
+    """Draws since each main number was last seen, from one pass over the range."""
+    row_count = len(filtered_df)
+    first_seen = np.full(51, row_count, dtype=np.int64)
+    np.minimum.at(first_seen, flat, row_idx)
+    draws_since_seen = first_seen[1:]
+
+    draw_labels = filtered_df["draw_date_label"].to_numpy()
+    last_seen_dates = [draw_labels[idx] if idx < row_count else "Never in range" for idx in draws_since_seen]
+    return pd.DataFrame(
+        {
+            "number": np.arange(1, 51),
+            "draws_since_seen": draws_since_seen,
+            "last_seen_date": last_seen_dates,
+        }
+    )
+
+
+def render_insights(draws_df: pd.DataFrame, main_arrays: tuple[np.ndarray, np.ndarray]) -> None:
     st.subheader("Insights")
     if draws_df.empty:
         st.info("No draw data available to generate insights.")
@@ -234,46 +374,32 @@ def render_insights(draws_df: pd.DataFrame) -> None:
     else:
         N = len(draws_df)
 
-    filtered_df = draws_df.head(N).copy()
+    filtered_df = draws_df.head(N)
 
     if selected == "All":
         st.caption("Based on all draws")
     else:
         st.caption(f"Based on last {len(filtered_df)} draws")
 
-    number_counter = Counter()
-    for values in filtered_df["numbers"]:
-        if isinstance(values, list):
-            number_counter.update(values)
-
-    if not number_counter:
+    # Rows are newest-first and row_idx is ascending, so the range is a prefix of the cached arrays.
+    all_flat, all_row_idx = main_arrays
+    cut = int(np.searchsorted(all_row_idx, len(filtered_df)))
+    flat, row_idx = all_flat[:cut], all_row_idx[:cut]
+    if not flat.size:
         st.warning("No number frequencies available for the selected range.")
         return
 
-    hot_number = number_counter.most_common(1)[0][0]
-    cold_number = sorted(number_counter.items(), key=lambda item: (item[1], item[0]))[0][0]
-
-    overdue_rows: list[dict] = []
-    for number in range(1, 51):
-        draws_since_seen = len(filtered_df)
-        last_seen_date = "Never in range"
-
-        for idx, row in filtered_df.iterrows():
-            values = row.get("numbers", [])
-            if isinstance(values, list) and number in values:
-                draws_since_seen = int(idx)
-                last_seen_date = format_uk_date(row.get("draw_date", ""))
-                break
-
-        overdue_rows.append(
-            {
-                "number": number,
-                "draws_since_seen": draws_since_seen,
-                "last_seen_date": last_seen_date,
-            }
-        )
+    counts = np.bincount(flat, minlength=51)[1:]
 
-    overdue_df = pd.DataFrame(overdue_rows).sort_values(
+    numbers = np.arange(1, 51)
+    hot_number = int(numbers[counts.argmax()])
+    cold_number = int(numbers[np.where(counts > 0, counts, counts.max() + 1).argmin()])
+    top_order = np.lexsort((numbers, -counts))[:10]
+    top_numbers = tuple(
+        (int(numbers[idx]), int(counts[idx])) for idx in top_order if counts[idx] > 0
+    )
+
+    overdue_df = _overdue_table(filtered_df, flat, row_idx).sort_values(
         ["draws_since_seen", "number"], ascending=[False, True]
     )
     overdue_number = int(overdue_df.iloc[0]["number"])
@@ -283,29 +409,25 @@ def render_insights(draws_df: pd.DataFrame) -> None:
     col2.metric("❄️ Cold", cold_number)
     col3.metric("⏳ Overdue", overdue_number)
 
-    freq_df = (
-        pd.DataFrame(
-            [{"number": number, "count": count} for number, count in number_counter.items()]
-        )
-        .sort_values("count", ascending=False)
-        .head(10)
-    )
     st.markdown("### Top 10 Frequency")
-    st.bar_chart(freq_df, x="count", y="number", horizontal=True, use_container_width=True)
+    st.altair_chart(_frequency_chart(top_numbers), use_container_width=True)
 
     st.markdown("### Most Overdue Numbers")
     st.dataframe(overdue_df.head(10), use_container_width=True, hide_index=True)
 
-    trend_df = filtered_df.copy()
-    trend_df["draw_date"] = trend_df["draw_date"].apply(format_uk_date)
-    trend_df["main_total"] = trend_df["numbers"].apply(lambda values: sum(values) if isinstance(values, list) else 0)
-    trend_df = trend_df.iloc[::-1]
+    trend_df = pd.DataFrame(
+        {
+            "draw_date": filtered_df["draw_date_label"],
+            "main_total": np.bincount(row_idx, weights=flat, minlength=len(filtered_df)).astype(np.int64),
+        }
+    ).iloc[::-1]
     st.markdown("### Recent Trend")
-    st.line_chart(trend_df.set_index("draw_date")[["main_total"]], use_container_width=True)
+    st.line_chart(trend_df.set_index("draw_date"), use_container_width=True)
 
 
-@st.cache_data(show_spinner=False)
-def compute_insights(draws: list[dict], topn: int = 5):
+@st.cache_data(ttl=DRAWS_TTL, max_entries=16, show_spinner=False)
+def _base_stats(draws_key: str, _draws: list[dict]) -> dict:
+    draws = _draws
     main_counter, star_counter = frequency_counter(draws)
     main_gap, star_gap = overdue_gaps(draws)
 
@@ -314,13 +436,24 @@ def compute_insights(draws: list[dict], topn: int = 5):
         "star_counter": star_counter,
         "main_gap": main_gap,
         "star_gap": star_gap,
+        "most_frequent_main": max(main_counter.items(), key=itemgetter(1), default=(None, 0))[0],
+        "most_frequent_star": max(star_counter.items(), key=itemgetter(1), default=(None, 0))[0],
+        "recent": recent_draw_summary(draws),
+    }
+
+
+def compute_insights(draws: list[dict], topn: int = 5):
+    base = _base_stats(_draws_cache_key(draws), draws)
+    main_counter, star_counter = base["main_counter"], base["star_counter"]
+
+    return {
+        **base,
         "hot_main": top_n(main_counter, topn, reverse=True),
         "hot_star": top_n(star_counter, min(topn, 3), reverse=True),
         "cold_main": top_n(main_counter, topn, reverse=False),
         "cold_star": top_n(star_counter, min(topn, 3), reverse=False),
-        "overdue_main": [n for n, _ in sorted(main_gap.items(), key=lambda item: item[1], reverse=True)[:topn]],
-        "overdue_star": [s for s, _ in sorted(star_gap.items(), key=lambda item: item[1], reverse=True)[: min(topn, 3)]],
-        "recent": recent_draw_summary(draws),
+        "overdue_main": most_overdue(base["main_gap"], topn),
+        "overdue_star": most_overdue(base["star_gap"], min(topn, 3)),
     }
 
 
@@ -335,14 +468,26 @@ else:
     st.title("Wilkos LuckyLogic")
     st.caption("Smarter EuroMillions picks")
 
-try:
-    all_draws = [draw_to_payload(draw) for draw in draws_provider.fetch_draws()]
-except requests.RequestException:
-    all_draws = []
+def _load_draws() -> tuple[list[dict], requests.RequestException | None]:
+    try:
+        return cached_draws(), None
+    except requests.RequestException as exc:
+        return [], exc
+
+
+# Draws and jackpot come from different hosts. Only when both caches may be cold is it worth
+# a worker thread to fetch them side by side; warm reruns stay on the script thread.
+if _cache_may_miss("draws", DRAWS_TTL) and _cache_may_miss("jackpot", JACKPOT_TTL):
+    with ThreadPoolExecutor(max_workers=1, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())) as pool:
+        draws_future = pool.submit(_load_draws)
+        meta = cached_jackpot()
+        all_draws, draws_error = draws_future.result()
+else:
+    all_draws, draws_error = _load_draws()
+    meta = cached_jackpot()
 
-ordered_draws = prepare_draws(all_draws, len(all_draws) if all_draws else 0)
+ordered_draws = all_draws
 most_recent = ordered_draws[0] if ordered_draws else None
-meta = cached_jackpot()
 jackpot_amount = meta.jackpot_amount
 if jackpot_amount is None:
     fallback_jackpot = _fallback_jackpot_from_draw(most_recent)
@@ -380,10 +525,8 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-draws_df = pd.DataFrame(ordered_draws)
-if not draws_df.empty:
-    draws_df["draw_date"] = draws_df.apply(draw_date_text, axis=1)
-draws_df = draws_df.reset_index(drop=True)
+draws_key = _draws_cache_key(ordered_draws)
+draws_df = _build_draws_df(draws_key, ordered_draws)
 
 pages = ["Picks", "Insights", "Tickets"]
 current_idx = pages.index(st.session_state["page"]) if st.session_state["page"] in pages else 0
@@ -475,16 +618,12 @@ if st.session_state["page"] == "Picks":
                     st.success("Ticket saved.")
 
     if generate:
-        with st.spinner("Fetching latest draw history..."):
-            if not all_draws:
-                try:
-                    all_draws = [draw_to_payload(draw) for draw in draws_provider.fetch_draws()]
-                except requests.RequestException as exc:
-                    st.error("Could not fetch draw data right now. Please try again in a moment.")
-                    st.caption(f"Technical details: {exc}")
-                    st.stop()
-
-        draws = prepare_draws(all_draws, max_draws)
+        if draws_error is not None:
+            st.error("Could not fetch draw data right now. Please try again in a moment.")
+            st.caption(f"Technical details: {draws_error}")
+            st.stop()
+
+        draws = all_draws[:max_draws]
         if not draws:
             st.warning("No draw data available from the API.")
             st.stop()
@@ -493,48 +632,38 @@ if st.session_state["page"] == "Picks":
         main_counter: Counter = insights["main_counter"]
         star_counter: Counter = insights["star_counter"]
 
-        last_draw_numbers = set(insights["recent"]["numbers"])
+        forbidden_mains = frozenset() if include_last_draw else frozenset(insights["recent"]["numbers"])
 
         generated_lines: list[dict] = []
 
         with main:
             m1, m2, m3 = st.columns(3)
             m1.metric("Draws loaded", len(draws))
-            m2.metric("Most frequent main", main_counter.most_common(1)[0][0])
-            m3.metric("Most frequent star", star_counter.most_common(1)[0][0])
-
-            st.markdown('<div class="em-results">', unsafe_allow_html=True)
-            for idx in range(1, line_count + 1):
-                nums, stars = build_line(strategy, main_counter, star_counter, draws)
-
-                if not include_last_draw:
-                    attempts = 0
-                    while set(nums).intersection(last_draw_numbers) and attempts < 10:
-                        nums, stars = build_line(strategy, main_counter, star_counter, draws)
-                        attempts += 1
-
-                score, explanation = explain_line(
-                    nums,
-                    stars,
-                    main_counter=main_counter,
-                    star_counter=star_counter,
-                    main_gap=insights["main_gap"],
-                    strategy=strategy,
-                )
-
+            m2.metric("Most frequent main", insights["most_frequent_main"])
+            m3.metric("Most frequent star", insights["most_frequent_star"])
+
+            lines = build_lines(strategy, main_counter, star_counter, draws, line_count, forbidden=forbidden_mains)
+            explained = explain_lines(
+                lines,
+                main_counter=main_counter,
+                star_counter=star_counter,
+                main_gap=insights["main_gap"],
+                strategy=strategy,
+            )
+            cards_markup: list[str] = []
+            for idx, ((nums, stars), (score, explanation)) in enumerate(zip(lines, explained), start=1):
                 generated_lines.append({"main": nums, "stars": stars})
                 reasons = [*explanation[:3], f"Strategy used: {strategy}"]
-                st.markdown(
-                    render_result_card(
-                        line_index=idx,
-                        main_nums=nums,
-                        stars=stars,
-                        confidence=score,
-                        reasons=reasons,
-                    ),
-                    unsafe_allow_html=True,
+                card = render_result_card(
+                    line_index=idx,
+                    main_nums=nums,
+                    stars=stars,
+                    confidence=score,
+                    reasons=reasons,
                 )
-            st.markdown('</div>', unsafe_allow_html=True)
+                cards_markup.append(card.strip())
+            # One element for all cards, so the em-results grid actually wraps them.
+            st.markdown(f'<div class="em-results">{"".join(cards_markup)}</div>', unsafe_allow_html=True)
 
             st.session_state["last_generated_lines"] = {
                 "lines": generated_lines,
@@ -573,14 +702,14 @@ if st.session_state["page"] == "Picks":
             )
 
 elif st.session_state["page"] == "Insights":
-    render_insights(draws_df)
+    render_insights(draws_df, _main_number_arrays(draws_key, draws_df))
 
 else:
     st.subheader("Tickets")
     st.caption("Save and track your generated lines here.")
     st.caption("Tickets are saved on this device (no login).")
 
-    export_payload = json.dumps(st.session_state["tickets"], indent=2)
+    export_payload = _tickets_export_payload()
     export_col, import_col = st.columns(2)
     with export_col:
         st.download_button(
@@ -611,13 +740,13 @@ else:
                 st.caption(f"Created: {created_at}")
                 st.write(f"Status: {ticket.get('status', 'Pending')}")
                 lines = safe_ticket_lines(ticket.get("lines", []))
-                for line_idx, line in enumerate(lines, start=1):
-                    st.markdown(f"**Line {line_idx}**")
-                    st.markdown(render_number_balls(line.main, line.stars), unsafe_allow_html=True)
+                if lines:
+                    st.markdown(_ticket_lines_markup(lines), unsafe_allow_html=True)
 
                 delete_key = f"delete_ticket_{ticket.get('id', index)}"
                 if st.button("Delete ticket", key=delete_key):
-                    st.session_state["tickets"] = [t for t in st.session_state["tickets"] if t.get("id") != ticket.get("id")]
+                    # Tickets render newest-first, so display index N maps to list position len - N.
+                    del st.session_state["tickets"][len(tickets) - index]
                     _persist_tickets()
                     st.success("Ticket deleted.")
                     st.rerun()
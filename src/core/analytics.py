@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from collections import Counter
+import heapq
+from operator import itemgetter
 from typing import Iterable
 
 from src.core.date_utils import format_uk_date
+from src.core.draws import normalize_int_list
 
-MAIN_RANGE = list(range(1, 51))
-STAR_RANGE = list(range(1, 13))
+MAIN_MAX = 50
+STAR_MAX = 12
+MAIN_RANGE = list(range(1, MAIN_MAX + 1))
+STAR_RANGE = list(range(1, STAR_MAX + 1))
 
 
 def parse_draw_date(draw: dict) -> str:
@@ -20,22 +25,9 @@ def parse_draw_date(draw: dict) -> str:
 
 def flatten_draw_values(draws: Iterable[dict]) -> tuple[list[int], list[int]]:
     numbers, stars = [], []
-
-    def _coerce_int(value: object) -> int | None:
-        try:
-            return int(value)
-        except (TypeError, ValueError):
-            return None
-
     for draw in draws:
-        for n in draw.get("numbers", []):
-            n_int = _coerce_int(n)
-            if n_int is not None:
-                numbers.append(n_int)
-        for s in draw.get("stars", []):
-            s_int = _coerce_int(s)
-            if s_int is not None:
-                stars.append(s_int)
+        numbers.extend(normalize_int_list(draw.get("numbers")))
+        stars.extend(normalize_int_list(draw.get("stars")))
     return numbers, stars
 
 
@@ -44,48 +36,58 @@ def frequency_counter(draws: list[dict]) -> tuple[Counter, Counter]:
     return Counter(numbers), Counter(stars)
 
 
+def _coerce_bounded(value: object, upper: int) -> int | None:
+    if value is None:
+        return None
+
+    try:
+        int_value = int(value)
+    except (TypeError, ValueError):
+        return None
+
+    if not 1 <= int_value <= upper:
+        return None
+    return int_value
+
+
 def overdue_gaps(draws: list[dict]) -> tuple[dict[int, int], dict[int, int]]:
     """Gap is draw distance from most recent appearance (0 means in latest draw).
 
     Expects draws ordered newest-first.
     """
     default_gap = len(draws) + 1
-    main_gap = {n: default_gap for n in MAIN_RANGE}
-    star_gap = {s: default_gap for s in STAR_RANGE}
-
-    def coerce_in_range(value: object, valid_range: range) -> int | None:
-        if value is None:
-            return None
+    # Dense first-seen buffers indexed by number; slot 0 is unused.
+    main_first = [default_gap] * (MAIN_MAX + 1)
+    star_first = [default_gap] * (STAR_MAX + 1)
 
-        try:
-            int_value = int(value)
-        except (TypeError, ValueError):
-            return None
-
-        if int_value not in valid_range:
-            return None
-        return int_value
+    main_unfilled, star_unfilled = MAIN_MAX, STAR_MAX
 
     for idx, draw in enumerate(draws):
         for n in draw.get("numbers", []):
-            n_int = coerce_in_range(n, range(1, 51))
-            if n_int is None:
-                continue
-            if main_gap.get(n_int, default_gap) == default_gap:
-                main_gap[n_int] = idx
+            n_int = _coerce_bounded(n, MAIN_MAX)
+            if n_int is not None and main_first[n_int] == default_gap:
+                main_first[n_int] = idx
+                main_unfilled -= 1
         for s in draw.get("stars", []):
-            s_int = coerce_in_range(s, range(1, 13))
-            if s_int is None:
-                continue
-            if star_gap.get(s_int, default_gap) == default_gap:
-                star_gap[s_int] = idx
+            s_int = _coerce_bounded(s, STAR_MAX)
+            if s_int is not None and star_first[s_int] == default_gap:
+                star_first[s_int] = idx
+                star_unfilled -= 1
+        # Every number has been seen; older draws cannot change any gap.
+        if not main_unfilled and not star_unfilled:
+            break
 
-    return main_gap, star_gap
+    return dict(zip(MAIN_RANGE, main_first[1:])), dict(zip(STAR_RANGE, star_first[1:]))
 
 
 def top_n(counter: Counter, n: int, reverse: bool = True) -> list[int]:
-    ordered = sorted(counter.items(), key=lambda item: item[1], reverse=reverse)
-    return [value for value, _ in ordered[:n]]
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    return [value for value, _ in select(n, counter.items(), key=itemgetter(1))]
+
+
+def most_overdue(gaps: dict[int, int], n: int) -> list[int]:
+    """Return the n values with the longest gaps, longest first."""
+    return [value for value, _ in heapq.nlargest(n, gaps.items(), key=itemgetter(1))]
 
 
 def recent_draw_summary(draws: list[dict]) -> dict:
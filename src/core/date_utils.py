@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from functools import lru_cache
 
 
 def _parse_date_like(value: object) -> date | datetime | None:
@@ -31,7 +32,19 @@ def _parse_date_like(value: object) -> date | datetime | None:
 
 def format_uk_date(d: object) -> str:
     """Format date values as UK short labels like 'Tue 03 Mar 2026'."""
+    if isinstance(d, str):
+        return _format_uk_date_text(d)
+
     parsed = _parse_date_like(d)
     if parsed is None:
         return str(d)
     return parsed.strftime("%a %d %b %Y")
+
+
+@lru_cache(maxsize=4096)
+def _format_uk_date_text(text: str) -> str:
+    # Draw and ticket dates repeat across reruns, so parsed strings are memoized.
+    parsed = _parse_date_like(text)
+    if parsed is None:
+        return text
+    return parsed.strftime("%a %d %b %Y")
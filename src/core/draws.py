@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
+from datetime import date, datetime
+from functools import lru_cache
+from operator import attrgetter
+import re
 
 from src.core.models import Draw
 
 
 DRAW_DATE_KEYS = ("date", "drawDate", "draw_date")
 JACKPOT_KEYS = ("estimatedJackpot", "jackpot", "jackpotAmount", "topPrize", "jackpot_amount")
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NON_DIGITS_RE = re.compile(r"\D+")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
 
 
 def parse_date_like(value: object) -> date | None:
@@ -18,10 +24,23 @@ def parse_date_like(value: object) -> date | None:
     if isinstance(value, date):
         return value
 
-    text = str(value).strip()
+    return _parse_date_text(str(value).strip())
+
+
+@lru_cache(maxsize=2048)
+def _parse_date_text(text: str) -> date | None:
+    # Draw dates are a small closed set that gets re-parsed by every sort, so results are memoized.
     if not text:
         return None
 
+    # Plain YYYY-MM-DD is what the draws API sends; build the date straight from its digits.
+    match = _ISO_DATE_RE.fullmatch(text)
+    if match:
+        try:
+            return date(int(match[1]), int(match[2]), int(match[3]))
+        except ValueError:
+            return None
+
     try:
         return datetime.fromisoformat(text.replace("Z", "+00:00")).date()
     except ValueError:
@@ -50,25 +69,41 @@ def parse_draw_timestamp(draw: dict) -> float:
         parsed = parse_date_like(value)
         if parsed is None:
             continue
-        return datetime(parsed.year, parsed.month, parsed.day, tzinfo=timezone.utc).timestamp()
+        # UTC midnight timestamp from the day ordinal, without building a datetime.
+        return (parsed.toordinal() - _EPOCH_ORDINAL) * 86400.0
     return float("-inf")
 
 
 def normalize_int_list(values: list | None) -> list[int]:
+    if not values:
+        return []
+    # API payloads are plain int lists; skip the int() calls entirely for them.
+    if all(type(value) is int for value in values):
+        return list(values)
+
+    try:
+        return [int(value) for value in values]
+    except (TypeError, ValueError):
+        pass
+
     normalized: list[int] = []
-    for value in values or []:
+    append = normalized.append
+    for value in values:
+        if value is None or value != value:  # None or NaN
+            continue
         try:
-            normalized.append(int(value))
+            append(int(value))
         except (TypeError, ValueError):
             continue
     return normalized
 
 
 def normalize_draw_dict(draw: dict) -> dict:
-    normalized = dict(draw)
-    normalized["numbers"] = normalize_int_list(draw.get("numbers"))
-    normalized["stars"] = normalize_int_list(draw.get("stars"))
-    return normalized
+    return {
+        **draw,
+        "numbers": normalize_int_list(draw.get("numbers")),
+        "stars": normalize_int_list(draw.get("stars")),
+    }
 
 
 def prepare_draws(draws: list[dict] | None, history_n: int) -> list[dict]:
@@ -77,12 +112,17 @@ def prepare_draws(draws: list[dict] | None, history_n: int) -> list[dict]:
     return ordered[:history_n]
 
 
+def order_draws(draws: list[Draw]) -> list[Draw]:
+    """Sort validated draws newest-first using their already-parsed dates."""
+    return sorted(draws, key=attrgetter("draw_date"), reverse=True)
+
+
 def parse_optional_jackpot(draw: dict) -> int | None:
     for key in JACKPOT_KEYS:
         raw = draw.get(key)
         if raw in (None, ""):
             continue
-        cleaned = "".join(ch for ch in str(raw) if ch.isdigit())
+        cleaned = _NON_DIGITS_RE.sub("", str(raw))
         if cleaned:
             return int(cleaned)
     return None
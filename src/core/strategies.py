@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from bisect import bisect
+import heapq
+from itertools import accumulate
 import random
 from collections import Counter
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Callable
 
-from src.core.analytics import MAIN_RANGE, STAR_RANGE, overdue_gaps
+from src.core.analytics import MAIN_MAX, MAIN_RANGE, STAR_MAX, STAR_RANGE, most_overdue, overdue_gaps
 
 
 STRATEGIES = [
@@ -14,18 +20,26 @@ STRATEGIES = [
     "Balanced Picks",
 ]
 
+_RNG = random.Random()
+
 
 def _safe_int_list(values: list) -> list[int]:
+    if all(type(value) is int for value in values):
+        return list(values)
+
     safe_values: list[int] = []
+    append = safe_values.append
     for value in values:
+        if value is None or value != value:  # None or NaN
+            continue
         try:
-            safe_values.append(int(value))
+            append(int(value))
         except (TypeError, ValueError):
             continue
     return safe_values
 
 
-def _weighted_unique_pick(counter: Counter, k: int, invert: bool = False) -> list[int]:
+def _weight_pool(counter: Counter, max_value: int, forbidden: frozenset[int] = frozenset()) -> dict[int, int]:
     pool: dict[int, int] = {}
     for value, weight in dict(counter).items():
         try:
@@ -33,61 +47,136 @@ def _weighted_unique_pick(counter: Counter, k: int, invert: bool = False) -> lis
             weight_int = int(weight)
         except (TypeError, ValueError):
             continue
+        if not 1 <= value_int <= max_value or value_int in forbidden:
+            continue
         pool[value_int] = max(1, weight_int)
+    return pool
+
+
+def _pick_from_pool(pool: dict[int, int], k: int, invert: bool, rng: random.Random) -> list[int]:
+    if not invert:
+        # Efraimidis-Spirakis: one u ** (1 / w) key per value; the k largest are a weighted draw
+        # without replacement, same distribution as picking one at a time.
+        random_ = rng.random
+        return sorted(heapq.nlargest(k, pool, key=lambda value: random_() ** (1.0 / pool[value])))
 
+    # Inverted weights depend on the largest weight still remaining, so draw one at a time.
+    remaining = list(pool.items())
     picked: list[int] = []
 
-    for _ in range(min(k, len(pool))):
-        choices = list(pool.keys())
-        weights = [pool[c] for c in choices]
-        if invert:
-            max_weight = max(weights)
-            weights = [max_weight - w + 1 for w in weights]
+    for _ in range(min(k, len(remaining))):
+        max_weight = max(weight for _, weight in remaining)
 
-        selected = random.choices(choices, weights=weights, k=1)[0]
-        picked.append(selected)
-        pool.pop(selected)
+        # Same selection as rng.choices(k=1), without its per-call argument handling.
+        cum_weights = list(accumulate(max_weight - weight + 1 for _, weight in remaining))
+        index = bisect(cum_weights, rng.random() * cum_weights[-1], 0, len(remaining) - 1)
+        picked.append(remaining.pop(index)[0])
 
     return sorted(picked)
 
 
-def _balanced_main_pick() -> list[int]:
+def _balanced_main_pick(forbidden: frozenset[int] = frozenset(), rng: random.Random = _RNG) -> list[int]:
     decades = [(1, 10), (11, 20), (21, 30), (31, 40), (41, 50)]
-    picks = [random.randint(start, end) for start, end in decades]
+    picks: list[int] = []
+    for start, end in decades:
+        if not any(start <= n <= end for n in forbidden):
+            picks.append(rng.randint(start, end))
+            continue
+        allowed = [n for n in range(start, end + 1) if n not in forbidden]
+        picks.append(rng.choice(allowed) if allowed else rng.randint(start, end))
     return sorted(picks)
 
 
-def _balanced_star_pick() -> list[int]:
-    return sorted([random.randint(1, 6), random.randint(7, 12)])
+def _balanced_star_pick(rng: random.Random = _RNG) -> list[int]:
+    return sorted([rng.randint(1, 6), rng.randint(7, 12)])
+
 
+def build_line(
+    strategy: str,
+    main_counter: Counter,
+    star_counter: Counter,
+    draws: list[dict],
+    forbidden: frozenset[int] = frozenset(),
+    rng: random.Random | None = None,
+) -> tuple[list[int], list[int]]:
+    """Build one line; main numbers in ``forbidden`` are never picked."""
+    return build_lines(strategy, main_counter, star_counter, draws, 1, forbidden=forbidden, rng=rng)[0]
 
-def build_line(strategy: str, main_counter: Counter, star_counter: Counter, draws: list[dict]) -> tuple[list[int], list[int]]:
+
+def build_lines(
+    strategy: str,
+    main_counter: Counter,
+    star_counter: Counter,
+    draws: list[dict],
+    count: int,
+    forbidden: frozenset[int] = frozenset(),
+    rng: random.Random | None = None,
+) -> list[tuple[list[int], list[int]]]:
+    """Build ``count`` lines, preparing the strategy's pools and gaps only once."""
     main_gap, star_gap = overdue_gaps(draws)
+    make_line = _line_builder(strategy, main_counter, star_counter, main_gap, star_gap, forbidden)
+    rng = rng or _RNG
+    return [make_line(rng) for _ in range(count)]
 
-    if strategy == "Hot Numbers":
-        main_nums = _weighted_unique_pick(main_counter, 5)
-        stars = _weighted_unique_pick(star_counter, 2)
-    elif strategy == "Cold Numbers":
-        main_nums = _weighted_unique_pick(main_counter, 5, invert=True)
-        stars = _weighted_unique_pick(star_counter, 2, invert=True)
-    elif strategy == "Overdue (Longest gap)":
-        main_nums = sorted([n for n, _ in sorted(main_gap.items(), key=lambda item: item[1], reverse=True)[:5]])
-        stars = sorted([s for s, _ in sorted(star_gap.items(), key=lambda item: item[1], reverse=True)[:2]])
-    elif strategy == "Balanced Picks":
-        main_nums = _balanced_main_pick()
-        stars = _balanced_star_pick()
-    else:  # AI Mode (Blend)
-        hot_main = _safe_int_list([n for n, _ in main_counter.most_common(12)])
-        overdue_main = [n for n, _ in sorted(main_gap.items(), key=lambda item: item[1], reverse=True)[:12]]
-        candidate_main = sorted(set(hot_main[:6] + overdue_main[:6] + MAIN_RANGE))
-        main_nums = sorted(random.sample(candidate_main, k=5))
 
-        hot_stars = _safe_int_list([s for s, _ in star_counter.most_common(6)])
-        overdue_stars = [s for s, _ in sorted(star_gap.items(), key=lambda item: item[1], reverse=True)[:6]]
-        candidate_stars = sorted(set(hot_stars[:3] + overdue_stars[:3] + STAR_RANGE))
-        stars = sorted(random.sample(candidate_stars, k=2))
+def _line_builder(
+    strategy: str,
+    main_counter: Counter,
+    star_counter: Counter,
+    main_gap: dict[int, int],
+    star_gap: dict[int, int],
+    forbidden: frozenset[int],
+) -> Callable[[random.Random], tuple[list[int], list[int]]]:
+    """Do the per-strategy setup once and return a function that samples one line."""
+    if strategy in ("Hot Numbers", "Cold Numbers"):
+        invert = strategy == "Cold Numbers"
+        main_pool = _weight_pool(main_counter, MAIN_MAX, forbidden)
+        star_pool = _weight_pool(star_counter, STAR_MAX)
+
+        def weighted_line(rng: random.Random) -> tuple[list[int], list[int]]:
+            return _pick_from_pool(main_pool, 5, invert, rng), _pick_from_pool(star_pool, 2, invert, rng)
+
+        return weighted_line
+
+    if strategy == "Overdue (Longest gap)":
+        allowed_gap = {n: gap for n, gap in main_gap.items() if n not in forbidden}
+        main_nums = sorted(most_overdue(allowed_gap, 5))
+        stars = sorted(most_overdue(star_gap, 2))
+        return lambda rng: (list(main_nums), list(stars))
+
+    if strategy == "Balanced Picks":
+        return lambda rng: (_balanced_main_pick(forbidden, rng), _balanced_star_pick(rng))
+
+    # AI Mode (Blend)
+    hot_main = _safe_int_list([n for n, _ in main_counter.most_common(12)])
+    overdue_main = most_overdue(main_gap, 12)
+    candidate_main = sorted(set(hot_main[:6] + overdue_main[:6] + MAIN_RANGE) - forbidden)
+
+    hot_stars = _safe_int_list([s for s, _ in star_counter.most_common(6)])
+    overdue_stars = most_overdue(star_gap, 6)
+    candidate_stars = sorted(set(hot_stars[:3] + overdue_stars[:3] + STAR_RANGE))
+
+    def blend_line(rng: random.Random) -> tuple[list[int], list[int]]:
+        return sorted(rng.sample(candidate_main, k=5)), sorted(rng.sample(candidate_stars, k=2))
+
+    return blend_line
 
-    return main_nums, stars
+
+@dataclass(frozen=True)
+class _ReferenceGroups:
+    hot_main: frozenset[int]
+    cold_main: frozenset[int]
+    overdue_main: frozenset[int]
+    hot_stars: frozenset[int]
+
+
+def _reference_groups(main_counter: Counter, star_counter: Counter, main_gap: dict[int, int]) -> _ReferenceGroups:
+    return _ReferenceGroups(
+        hot_main=frozenset(_safe_int_list([n for n, _ in main_counter.most_common(10)])),
+        cold_main=frozenset(_safe_int_list([n for n, _ in heapq.nsmallest(10, main_counter.items(), key=itemgetter(1))])),
+        overdue_main=frozenset(_safe_int_list(most_overdue(main_gap, 10))),
+        hot_stars=frozenset(_safe_int_list([s for s, _ in star_counter.most_common(4)])),
+    )
 
 
 def explain_line(
@@ -97,6 +186,28 @@ def explain_line(
     star_counter: Counter,
     main_gap: dict[int, int],
     strategy: str,
+) -> tuple[int, list[str]]:
+    groups = _reference_groups(main_counter, star_counter, main_gap)
+    return _explain_with_groups(main_nums, stars, groups, strategy)
+
+
+def explain_lines(
+    lines: list[tuple[list[int], list[int]]],
+    main_counter: Counter,
+    star_counter: Counter,
+    main_gap: dict[int, int],
+    strategy: str,
+) -> list[tuple[int, list[str]]]:
+    """Score and explain several lines, ranking hot/cold/overdue groups once."""
+    groups = _reference_groups(main_counter, star_counter, main_gap)
+    return [_explain_with_groups(main_nums, stars, groups, strategy) for main_nums, stars in lines]
+
+
+def _explain_with_groups(
+    main_nums: list[int],
+    stars: list[int],
+    groups: _ReferenceGroups,
+    strategy: str,
 ) -> tuple[int, list[str]]:
     safe_main_nums = sorted(_safe_int_list(main_nums))
     safe_stars = sorted(_safe_int_list(stars))
@@ -104,9 +215,9 @@ def explain_line(
     if len(safe_main_nums) < 2:
         return 0, ["Not enough valid numbers to explain this line."]
 
-    hot_main = set(_safe_int_list([n for n, _ in main_counter.most_common(10)]))
-    cold_main = set(_safe_int_list([n for n, _ in sorted(main_counter.items(), key=lambda item: item[1])[:10]]))
-    overdue_main = set(_safe_int_list([n for n, _ in sorted(main_gap.items(), key=lambda item: item[1], reverse=True)[:10]]))
+    hot_main = groups.hot_main
+    cold_main = groups.cold_main
+    overdue_main = groups.overdue_main
 
     hot_hits = len([n for n in safe_main_nums if n in hot_main])
     cold_hits = len([n for n in safe_main_nums if n in cold_main])
@@ -149,8 +260,7 @@ def explain_line(
         explanations.insert(0, "Leans into less frequent historical outcomes.")
 
     if safe_stars:
-        hot_stars = set(_safe_int_list([s for s, _ in star_counter.most_common(4)]))
-        star_hot_hits = len([s for s in safe_stars if s in hot_stars])
+        star_hot_hits = len([s for s in safe_stars if s in groups.hot_stars])
         explanations.append(f"Lucky stars include {star_hot_hits} from the recent high-frequency group.")
 
     return score, explanations[:4]
@@ -62,15 +62,15 @@ def prepare_ticket_match_rows(
 ) -> list[dict]:
     rows: list[dict] = []
     for line in ticket.lines[:5]:
-        matched_mains = set(line.main) & winning_mains if should_check_matches else set()
-        matched_stars = set(line.stars) & winning_stars if should_check_matches else set()
+        matched_mains = winning_mains.intersection(line.main) if should_check_matches else set()
+        matched_stars = winning_stars.intersection(line.stars) if should_check_matches else set()
         rows.append(
             {
                 "main": list(line.main),
                 "stars": list(line.stars),
                 "matched_mains": matched_mains,
                 "matched_stars": matched_stars,
-                "matches": count_line_matches(line, winning_mains, winning_stars) if should_check_matches else "—",
+                "matches": len(matched_mains) + len(matched_stars) if should_check_matches else "—",
                 "pending_label": pending_label,
             }
         )
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
+import io
 import re
 from typing import Optional
 import xml.etree.ElementTree as ET
 
 import requests
 
+from src.services.http_session import shared_session
+from src.services.json_codec import decode_json
 
 NATIONAL_LOTTERY_XML_URL = "https://www.national-lottery.co.uk/results/euromillions/draw-history/xml"
 NATIONAL_LOTTERY_RESULTS_URL = "https://www.national-lottery.co.uk/results/euromillions"
@@ -24,6 +26,20 @@ _BROWSER_HEADERS = {
 }
 
 
+_XML_JACKPOT_TAGS = ("next-estimated-jackpot", "jackpot-amount", "jackpotAmount")
+_XML_DRAW_TAGS = frozenset({"next-draw-date", "next-draw-day"})
+_XML_FIELD_TAGS = frozenset(_XML_JACKPOT_TAGS) | _XML_DRAW_TAGS
+_HTML_JACKPOT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"£\s*(\d{1,3}(?:,\d{3})+)",
+        r"£\s*(\d+(?:\.\d+)?)\s*(million|m)\b",
+        r"jackpot[^£\d]{0,40}£\s*(\d+(?:,\d{3})*)",
+    )
+)
+_PEDRO_JACKPOT_KEYS = ("nextEstimatedJackpot", "next_estimated_jackpot", "estimatedJackpot", "jackpot")
+
+
 @dataclass
 class JackpotInfo:
     ok: bool
@@ -56,34 +72,55 @@ def _try_int(s: str) -> Optional[int]:
 
 def _safe_get(url: str, headers: dict | None = None, timeout: int = 10) -> tuple[bool, str, Optional[str]]:
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = shared_session().get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
         return True, "", response.text
     except requests.RequestException as exc:
         return False, str(exc), None
 
 
+def _xml_jackpot_settled(found: dict[str, str]) -> bool:
+    """True once no later tag can change which jackpot text the findtext-style fallback picks."""
+    for tag in _XML_JACKPOT_TAGS:
+        if tag not in found:
+            return False
+        if found[tag]:
+            return True
+    return True
+
+
+def _xml_field_texts(body: str) -> dict[str, str]:
+    """First text of each jackpot/next-draw tag, streaming the XML and stopping once the result is settled."""
+    found: dict[str, str] = {}
+    for _, elem in ET.iterparse(io.StringIO(body)):
+        tag = elem.tag
+        if tag in _XML_FIELD_TAGS and tag not in found:
+            found[tag] = elem.text or ""
+            if _XML_DRAW_TAGS <= found.keys() and _xml_jackpot_settled(found):
+                break
+        elem.clear()
+    return found
+
+
 def fetch_from_national_lottery_xml() -> JackpotInfo:
     ok, error, body = _safe_get(NATIONAL_LOTTERY_XML_URL, headers=_BROWSER_HEADERS, timeout=10)
     if not ok or body is None:
         return JackpotInfo(False, "national_lottery_xml", None, None, None, None, error or "XML request failed")
 
     try:
-        root = ET.fromstring(body)
+        fields = _xml_field_texts(body)
+        next_draw_date = fields.get("next-draw-date", "").strip() or None
+        next_draw_day = fields.get("next-draw-day", "").strip().title() or None
 
-        jackpot_text = (
-            root.findtext(".//next-estimated-jackpot")
-            or root.findtext(".//jackpot-amount")
-            or root.findtext(".//jackpotAmount")
-        )
+        jackpot_text = next((fields[tag] for tag in _XML_JACKPOT_TAGS if fields.get(tag)), None)
         amount = _try_int(jackpot_text or "")
         if amount is None:
             return JackpotInfo(
                 False,
                 "national_lottery_xml",
                 None,
-                (root.findtext(".//next-draw-date") or "").strip() or None,
-                (root.findtext(".//next-draw-day") or "").strip().title() or None,
+                next_draw_date,
+                next_draw_day,
                 jackpot_text,
                 "No parseable jackpot in XML",
             )
@@ -92,8 +129,8 @@ def fetch_from_national_lottery_xml() -> JackpotInfo:
             True,
             "national_lottery_xml",
             format_jackpot_display(amount),
-            (root.findtext(".//next-draw-date") or "").strip() or None,
-            (root.findtext(".//next-draw-day") or "").strip().title() or None,
+            next_draw_date,
+            next_draw_day,
             jackpot_text,
             None,
         )
@@ -109,17 +146,11 @@ def fetch_from_national_lottery_html() -> JackpotInfo:
         return JackpotInfo(False, "national_lottery_html", None, None, None, None, error or "HTML request failed")
 
     try:
-        patterns = [
-            r"£\s*(\d{1,3}(?:,\d{3})+)",
-            r"£\s*(\d+(?:\.\d+)?)\s*(million|m)\b",
-            r"jackpot[^£\d]{0,40}£\s*(\d+(?:,\d{3})*)",
-        ]
-
         amount: Optional[int] = None
         raw_match: Optional[str] = None
 
-        for pattern in patterns:
-            match = re.search(pattern, body, flags=re.IGNORECASE)
+        for pattern in _HTML_JACKPOT_PATTERNS:
+            match = pattern.search(body)
             if not match:
                 continue
 
@@ -149,11 +180,11 @@ def fetch_from_pedro_api() -> JackpotInfo:
         return JackpotInfo(False, "pedro_api", None, None, None, None, error or "Draw API request failed")
 
     try:
-        payload = json.loads(body)
+        payload = decode_json(body)
         latest = payload[0] if isinstance(payload, list) and payload else payload if isinstance(payload, dict) else {}
 
         jackpot_raw = None
-        for key in ("nextEstimatedJackpot", "next_estimated_jackpot", "estimatedJackpot", "jackpot"):
+        for key in _PEDRO_JACKPOT_KEYS:
             value = latest.get(key) if isinstance(latest, dict) else None
             if value not in (None, ""):
                 jackpot_raw = str(value)
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import requests
 
-DRAWS_API_URL = "https://euromillions.api.pedromealha.dev/v1/draws"
+from src.services.draws_provider_http import DRAWS_API_URL
+from src.services.http_session import shared_session
+from src.services.json_codec import decode_json
 
 
 def fetch_draws() -> list[dict]:
     """Fetch draw history from public provider."""
-    response = requests.get(DRAWS_API_URL, timeout=10)
+    response = shared_session().get(DRAWS_API_URL, timeout=10)
     response.raise_for_status()
-    payload = response.json()
+    try:
+        payload = decode_json(response.content)
+    except ValueError as exc:
+        raise requests.exceptions.InvalidJSONError(f"Draws API returned invalid JSON: {exc}") from exc
     return payload if isinstance(payload, list) else []
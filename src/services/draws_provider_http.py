@@ -1,24 +1,53 @@
 from __future__ import annotations
 
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+
 import requests
 
 from src.core.draws import draw_from_payload
 from src.core.models import Draw
+from src.services.http_session import shared_session
+from src.services.json_codec import decode_json
 
 DRAWS_API_URL = "https://euromillions.api.pedromealha.dev/v1/draws"
+# Per-user location: a fixed name in the shared temp dir could be planted or held by another local user.
+DRAWS_CACHE_PATH = Path.home() / ".cache" / "euromillions-predictor" / "draws.json"
+DRAWS_CACHE_MAX_AGE = 60 * 60
 
 
 class HttpDrawsProvider:
-    def __init__(self, api_url: str = DRAWS_API_URL, timeout: int = 10) -> None:
+    def __init__(
+        self,
+        api_url: str = DRAWS_API_URL,
+        timeout: int = 10,
+        session: requests.Session | None = None,
+        cache_path: Path | None = None,
+        cache_max_age: float = DRAWS_CACHE_MAX_AGE,
+    ) -> None:
         self.api_url = api_url
         self.timeout = timeout
+        self.session = session or shared_session()
+        self.cache_path = cache_path
+        self.cache_max_age = cache_max_age
 
     def fetch_draws(self) -> list[Draw]:
-        response = requests.get(self.api_url, timeout=self.timeout)
-        response.raise_for_status()
-        payload = response.json()
+        content, validators = self._fetch_body()
+
+        try:
+            payload = decode_json(content)
+        except ValueError as exc:
+            if validators is None:
+                # The bad body came from disk; drop it so the next fetch goes back to the API.
+                self._discard_cache()
+            raise requests.exceptions.InvalidJSONError(f"Draws API returned invalid JSON: {exc}") from exc
         if not isinstance(payload, list):
             return []
+        if validators is not None:
+            self._write_cache(content, validators)
 
         draws: list[Draw] = []
         for item in payload:
@@ -28,3 +57,89 @@ class HttpDrawsProvider:
             if draw is not None:
                 draws.append(draw)
         return draws
+
+    def _fetch_body(self) -> tuple[bytes, dict[str, str] | None]:
+        """API body plus its ETag/Last-Modified validators; None when served from the disk cache."""
+        cached = self._read_cache()
+        headers = self._cache_validators() if cached is not None else {}
+        try:
+            response = self.session.get(self.api_url, timeout=self.timeout, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                self._touch_cache()
+                return cached[0], None
+            response.raise_for_status()
+        except requests.RequestException:
+            # Always revalidate so new results show up on the next in-memory miss;
+            # a recent disk copy only stands in when the API cannot be reached.
+            if cached is not None and cached[1]:
+                return cached[0], None
+            raise
+        validators = {
+            key: response.headers[header]
+            for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified"))
+            if response.headers.get(header)
+        }
+        return response.content, validators
+
+    def _read_cache(self) -> tuple[bytes, bool] | None:
+        """Cached API body and whether it is younger than cache_max_age, if a disk cache is configured."""
+        if self.cache_path is None:
+            return None
+        try:
+            age = time.time() - self.cache_path.stat().st_mtime
+            return self.cache_path.read_bytes(), age <= self.cache_max_age
+        except OSError:
+            return None
+
+    def _cache_validators(self) -> dict[str, str]:
+        try:
+            meta = json.loads(self._meta_path().read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(meta, dict):
+            return {}
+        headers: dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = str(meta["etag"])
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = str(meta["last_modified"])
+        return headers
+
+    def _meta_path(self) -> Path:
+        return self.cache_path.with_name(self.cache_path.name + ".meta")
+
+    def _discard_cache(self) -> None:
+        for path in (self.cache_path, self._meta_path()):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _touch_cache(self) -> None:
+        try:
+            os.utime(self.cache_path)
+        except OSError:
+            pass
+
+    def _write_cache(self, content: bytes, validators: dict[str, str]) -> None:
+        if self.cache_path is None:
+            return
+        if _atomic_write(self.cache_path, content):
+            _atomic_write(self._meta_path(), json.dumps(validators).encode())
+
+
+def _atomic_write(path: Path, content: bytes) -> bool:
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+        # Atomic swap so a concurrent reader never sees a half-written file.
+        os.replace(tmp_name, path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+        return False
+    return True
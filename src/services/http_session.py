@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (502, 503, 504)
+
+
+@lru_cache(maxsize=1)
+def shared_session() -> requests.Session:
+    """Return the process-wide pooled session so providers reuse open connections."""
+    # Retry the listed gateway statuses and a failed connect, never a read timeout: each retried
+    # timeout would add a full `timeout` to a call made on the script thread.
+    retries = Retry(
+        total=2,
+        connect=1,
+        read=0,
+        other=0,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional faster parser
+    orjson = None
+
+
+def decode_json(content: bytes | str) -> object:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def encode_json_pretty(payload: object) -> str:
+    """Serialize to 2-space indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(payload, indent=2)
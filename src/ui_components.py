@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from src.date_utils import format_uk_date
+from functools import lru_cache
 from html import escape
+import re
+
+
+_NON_AMOUNT_CHARS_RE = re.compile(r"[^\d.]+")
 
 
 def _first_available(draw: dict, keys: tuple[str, ...]) -> object | None:
@@ -26,9 +31,9 @@ def _format_jackpot(value: object) -> str | None:
         return f"£{int(round(value)):,}"
 
     text = str(value).strip()
-    digits = "".join(ch for ch in text if ch.isdigit() or ch in ".,")
-    if digits:
-        normalized = digits.replace(",", "")
+    # Keep only digits and the decimal point: drops currency, separators and words in one pass.
+    normalized = _NON_AMOUNT_CHARS_RE.sub("", text)
+    if normalized:
         try:
             return f"£{int(float(normalized)):,}"
         except ValueError:
@@ -144,6 +149,17 @@ def render_balls(main_nums: list[int], stars: list[int]) -> str:
     return render_number_balls(main_nums, stars)
 
 
+@lru_cache(maxsize=256)
+def _main_ball(value: int, matched: bool) -> str:
+    # Only ~100 distinct balls exist, so each span is formatted once per process.
+    return f'<span class="wl-ball wl-ball--main{" wl-ball--matched" if matched else ""}">{value}</span>'
+
+
+@lru_cache(maxsize=64)
+def _star_ball(value: int, matched: bool) -> str:
+    return f'<span class="wl-ball wl-ball--star{" wl-ball--matched" if matched else ""}"><span>{value}</span></span>'
+
+
 def render_number_balls(
     mains: list[int],
     stars: list[int] | None = None,
@@ -154,18 +170,8 @@ def render_number_balls(
     matched_mains = matched_mains or set()
     matched_stars = matched_stars or set()
 
-    main_markup = "".join(
-        [
-            f'<span class="wl-ball wl-ball--main{" wl-ball--matched" if int(value) in matched_mains else ""}">{int(value)}</span>'
-            for value in mains
-        ]
-    )
-    stars_markup = "".join(
-        [
-            f'<span class="wl-ball wl-ball--star{" wl-ball--matched" if int(value) in matched_stars else ""}"><span>{int(value)}</span></span>'
-            for value in (stars or [])
-        ]
-    )
+    main_markup = "".join([_main_ball(value, value in matched_mains) for value in map(int, mains)])
+    stars_markup = "".join([_star_ball(value, value in matched_stars) for value in map(int, stars or [])])
     divider_markup = '<div class="number-ball-divider">+</div>' if show_plus and stars_markup else ""
 
     return (
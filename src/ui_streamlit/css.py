@@ -1,9 +1,20 @@
+from functools import lru_cache
+from pathlib import Path
+
+CSS_PATH = Path(__file__).resolve().parents[1] / "styles" / "app.css"
+
+
+@lru_cache(maxsize=1)
+def _style_markup() -> str:
+    if not CSS_PATH.exists():
+        return ""
+    css = CSS_PATH.read_text(encoding="utf-8")
+    return f"<style>{css}</style>"
+
+
 def inject_css():
-    from pathlib import Path
     import streamlit as st
 
-    css_path = Path(__file__).resolve().parents[1] / "styles" / "app.css"
-
-    if css_path.exists():
-        css = css_path.read_text(encoding="utf-8")
-        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+    style_markup = _style_markup()
+    if style_markup:
+        st.markdown(style_markup, unsafe_allow_html=True)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from src.core.date_utils import format_uk_date
+
+
+def uk_date_labels(values: pd.Series) -> pd.Series:
+    """format_uk_date over a column: one vectorized parse for plain ISO dates, scalar fallback for the rest."""
+    labels = pd.to_datetime(values, format="%Y-%m-%d", errors="coerce").dt.strftime("%a %d %b %Y")
+    unparsed = labels.isna()
+    if unparsed.any():
+        labels = labels.mask(unparsed, values[unparsed].map(format_uk_date))
+    return labels
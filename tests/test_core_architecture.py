@@ -1,9 +1,20 @@
+from collections import Counter
 from datetime import date
+import random
 
+from src.core.analytics import frequency_counter, most_overdue, overdue_gaps
 from src.core.draw_dates import upcoming_draw_dates
-from src.core.draws import prepare_draws
-from src.core.models import Line
-from src.core.tickets import count_line_matches
+from src.core.draws import order_draws, prepare_draws
+from src.core.models import Draw, Line, Ticket
+from src.core.strategies import STRATEGIES, build_line, build_lines
+from src.core.tickets import count_line_matches, prepare_ticket_match_rows
+
+
+def _sample_history() -> tuple[list[dict], Counter, Counter]:
+    """Ten draws covering mains 1-50 in order, with their frequency counters."""
+    draws = [{"numbers": [n, n + 1, n + 2, n + 3, n + 4], "stars": [1, 2]} for n in range(1, 46, 5)]
+    main_counter, star_counter = frequency_counter(draws)
+    return draws, main_counter, star_counter
 
 
 def test_draw_date_parsing_and_sorting() -> None:
@@ -36,3 +47,96 @@ def test_upcoming_draw_dates() -> None:
     assert len(draws) == 4
     assert all(draw.weekday() in {1, 4} for draw in draws)
     assert draws[0] == date(2026, 3, 3)
+
+
+def test_most_overdue_orders_longest_gap_first() -> None:
+    gaps = {1: 0, 2: 7, 3: 3, 4: 7, 5: 12}
+
+    assert most_overdue(gaps, 3) == [5, 2, 4]
+
+
+class _UnreachableDraw(dict):
+    def get(self, key, default=None):
+        raise AssertionError("overdue_gaps read a draw after every number was already seen")
+
+
+def test_overdue_gaps_stop_once_every_number_is_seen() -> None:
+    covering = [{"numbers": list(range(n, n + 5)), "stars": [n % 12 + 1, (n + 6) % 12 + 1]} for n in range(1, 51, 5)]
+    draws = covering + [_UnreachableDraw()]
+
+    main_gap, star_gap = overdue_gaps(draws)
+
+    assert main_gap[1] == 0 and main_gap[50] == 9
+    assert max(star_gap.values()) < len(covering)
+
+
+def test_build_line_never_picks_forbidden_mains() -> None:
+    draws, main_counter, star_counter = _sample_history()
+    forbidden = frozenset({3, 14, 25, 36, 47})
+
+    for strategy in STRATEGIES:
+        main_nums, stars = build_line(strategy, main_counter, star_counter, draws, forbidden=forbidden)
+        assert len(main_nums) == 5
+        assert not forbidden.intersection(main_nums)
+
+
+def test_cold_picks_ignore_out_of_range_counter_keys() -> None:
+    draws, main_counter, star_counter = _sample_history()
+    main_counter[10**12] += 1
+    star_counter[10**12] += 1
+
+    for main_nums, stars in build_lines("Cold Numbers", main_counter, star_counter, draws, 20):
+        assert len(set(main_nums)) == 5 and all(1 <= n <= 50 for n in main_nums)
+        assert len(set(stars)) == 2 and all(1 <= s <= 12 for s in stars)
+
+
+def test_order_draws_newest_first() -> None:
+    draws = [
+        Draw(draw_date=date(2026, 3, 3), numbers=[1, 2, 3, 4, 5], stars=[1, 2]),
+        Draw(draw_date=date(2026, 3, 10), numbers=[6, 7, 8, 9, 10], stars=[3, 4]),
+        Draw(draw_date=date(2026, 3, 6), numbers=[11, 12, 13, 14, 15], stars=[5, 6]),
+    ]
+
+    ordered = order_draws(draws)
+
+    assert [draw.draw_date.day for draw in ordered] == [10, 6, 3]
+
+
+def test_build_lines_returns_requested_count() -> None:
+    draws, main_counter, star_counter = _sample_history()
+
+    lines = build_lines("Hot Numbers", main_counter, star_counter, draws, 4)
+
+    assert len(lines) == 4
+    assert all(len(main) == 5 and len(stars) == 2 for main, stars in lines)
+
+
+def test_build_lines_is_reproducible_with_seeded_rng() -> None:
+    draws, main_counter, star_counter = _sample_history()
+
+    for strategy in STRATEGIES:
+        first = build_lines(strategy, main_counter, star_counter, draws, 3, rng=random.Random(7))
+        second = build_lines(strategy, main_counter, star_counter, draws, 3, rng=random.Random(7))
+        assert first == second
+
+
+def test_ticket_match_rows_reuse_matched_sets() -> None:
+    ticket = Ticket(
+        id="t1",
+        created_at="2026-03-01T00:00:00+00:00",
+        draw_date="2026-03-03",
+        draw_label="Tue 03 Mar 2026",
+        strategy="Hot Numbers",
+        lines=[Line(main=[3, 11, 19, 27, 45], stars=[2, 9])],
+    )
+
+    rows = prepare_ticket_match_rows(
+        ticket,
+        winning_mains=frozenset({11, 27, 42}),
+        winning_stars=frozenset({9, 12}),
+        should_check_matches=True,
+    )
+
+    assert rows[0]["matched_mains"] == {11, 27}
+    assert rows[0]["matched_stars"] == {9}
+    assert rows[0]["matches"] == 3
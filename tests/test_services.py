@@ -0,0 +1,191 @@
+import json
+import os
+from pathlib import Path
+import time
+
+import pytest
+import requests
+
+from src import jackpot_service
+from src.services import draws_provider_http, http_session
+from src.services.draws_provider_http import HttpDrawsProvider
+
+DRAWS_BODY = b'[{"date": "2026-03-03", "numbers": [1, 2, 3, 4, 5], "stars": [1, 2]}]'
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int = 200, content: bytes = DRAWS_BODY, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class _FakeSession:
+    def __init__(self, *responses: _FakeResponse | Exception) -> None:
+        self.responses = list(responses)
+        self.requests: list[dict] = []
+
+    def get(self, url: str, timeout: int, headers: dict | None = None) -> _FakeResponse:
+        self.requests.append(dict(headers or {}))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _age(path: Path, seconds: float) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_invalid_draws_json_raises_request_exception() -> None:
+    provider = HttpDrawsProvider(session=_FakeSession(_FakeResponse(content=b"<html>oops</html>")))
+
+    with pytest.raises(requests.RequestException):
+        provider.fetch_draws()
+
+
+def test_xml_jackpot_falls_back_past_an_empty_preferred_tag(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        "<draw-results>"
+        "<next-estimated-jackpot></next-estimated-jackpot>"
+        "<next-draw-date>2026-03-06</next-draw-date>"
+        "<next-draw-day>friday</next-draw-day>"
+        "<jackpot-amount>£17,000,000</jackpot-amount>"
+        "</draw-results>"
+    )
+    monkeypatch.setattr(jackpot_service, "_safe_get", lambda *args, **kwargs: (True, "", body))
+
+    info = jackpot_service.fetch_from_national_lottery_xml()
+
+    assert info.ok
+    assert info.raw == "£17,000,000"
+    assert info.jackpot_amount == "£17 Million"
+    assert (info.next_draw_date, info.next_draw_day) == ("2026-03-06", "Friday")
+
+
+def test_xml_jackpot_prefers_next_estimated_over_earlier_amount(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = (
+        "<draw-results>"
+        "<jackpot-amount>£9,000,000</jackpot-amount>"
+        "<next-draw-date>2026-03-06</next-draw-date>"
+        "<next-draw-day>friday</next-draw-day>"
+        "<next-estimated-jackpot>£17,000,000</next-estimated-jackpot>"
+        "</draw-results>"
+    )
+    monkeypatch.setattr(jackpot_service, "_safe_get", lambda *args, **kwargs: (True, "", body))
+
+    assert jackpot_service.fetch_from_national_lottery_xml().raw == "£17,000,000"
+
+
+def test_fresh_disk_cache_is_still_revalidated(tmp_path: Path) -> None:
+    cache_path = tmp_path / "draws.json"
+    cache_path.write_bytes(b"[]")
+    (tmp_path / "draws.json.meta").write_text(json.dumps({"etag": '"v1"'}))
+    session = _FakeSession(_FakeResponse(headers={"ETag": '"v2"'}))
+
+    draws = HttpDrawsProvider(session=session, cache_path=cache_path).fetch_draws()
+
+    assert session.requests == [{"If-None-Match": '"v1"'}]
+    assert len(draws) == 1
+    assert cache_path.read_bytes() == DRAWS_BODY
+
+
+def test_fresh_disk_cache_is_served_when_the_api_is_down(tmp_path: Path) -> None:
+    cache_path = tmp_path / "draws.json"
+    cache_path.write_bytes(DRAWS_BODY)
+    session = _FakeSession(requests.ConnectionError("offline"))
+
+    draws = HttpDrawsProvider(session=session, cache_path=cache_path).fetch_draws()
+
+    assert [draw.numbers for draw in draws] == [[1, 2, 3, 4, 5]]
+
+
+def test_stale_disk_cache_is_not_served_when_the_api_is_down(tmp_path: Path) -> None:
+    cache_path = tmp_path / "draws.json"
+    cache_path.write_bytes(DRAWS_BODY)
+    _age(cache_path, seconds=2 * 60 * 60)
+    provider = HttpDrawsProvider(session=_FakeSession(requests.ConnectionError("offline")), cache_path=cache_path)
+
+    with pytest.raises(requests.ConnectionError):
+        provider.fetch_draws()
+
+
+def test_stale_disk_cache_is_refetched_and_replaced(tmp_path: Path) -> None:
+    cache_path = tmp_path / "draws.json"
+    cache_path.write_bytes(b"[]")
+    _age(cache_path, seconds=2 * 60 * 60)
+    session = _FakeSession(_FakeResponse())
+
+    draws = HttpDrawsProvider(session=session, cache_path=cache_path).fetch_draws()
+
+    assert len(draws) == 1
+    assert len(session.requests) == 1
+    assert cache_path.read_bytes() == DRAWS_BODY
+
+
+def test_undecodable_disk_cache_is_discarded(tmp_path: Path) -> None:
+    cache_path = tmp_path / "draws.json"
+    cache_path.write_bytes(b"{truncated")
+    session = _FakeSession(_FakeResponse(status_code=304, content=b""))
+    provider = HttpDrawsProvider(session=session, cache_path=cache_path)
+
+    with pytest.raises(requests.RequestException):
+        provider.fetch_draws()
+    assert not cache_path.exists()
+
+
+def test_failed_cache_write_still_returns_draws(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_path = tmp_path / "draws.json"
+
+    def refuse_replace(src: str, dst: Path) -> None:
+        raise PermissionError("cache file is not ours")
+
+    monkeypatch.setattr(draws_provider_http.os, "replace", refuse_replace)
+
+    draws = HttpDrawsProvider(session=_FakeSession(_FakeResponse()), cache_path=cache_path).fetch_draws()
+
+    assert len(draws) == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fresh_download_saves_validators_next_to_the_body(tmp_path: Path) -> None:
+    cache_path = tmp_path / "draws.json"
+    response = _FakeResponse(headers={"ETag": '"v1"', "Last-Modified": "Tue, 03 Mar 2026 21:00:00 GMT"})
+
+    HttpDrawsProvider(session=_FakeSession(response), cache_path=cache_path).fetch_draws()
+
+    meta = json.loads((tmp_path / "draws.json.meta").read_text())
+    assert meta == {"etag": '"v1"', "last_modified": "Tue, 03 Mar 2026 21:00:00 GMT"}
+
+
+def test_stale_cache_is_revalidated_and_reused_on_304(tmp_path: Path) -> None:
+    cache_path = tmp_path / "draws.json"
+    cache_path.write_bytes(DRAWS_BODY)
+    (tmp_path / "draws.json.meta").write_text(
+        json.dumps({"etag": '"v1"', "last_modified": "Tue, 03 Mar 2026 21:00:00 GMT"})
+    )
+    _age(cache_path, seconds=2 * 60 * 60)
+    session = _FakeSession(_FakeResponse(status_code=304, content=b""))
+
+    draws = HttpDrawsProvider(session=session, cache_path=cache_path).fetch_draws()
+
+    assert session.requests == [
+        {"If-None-Match": '"v1"', "If-Modified-Since": "Tue, 03 Mar 2026 21:00:00 GMT"}
+    ]
+    assert [draw.numbers for draw in draws] == [[1, 2, 3, 4, 5]]
+    assert cache_path.read_bytes() == DRAWS_BODY
+    assert time.time() - cache_path.stat().st_mtime < 60
+
+
+def test_shared_session_does_not_retry_read_timeouts() -> None:
+    retries = http_session.shared_session().get_adapter("https://").max_retries
+
+    assert retries.read == 0
+    assert retries.connect == 1
+    assert set(retries.status_forcelist) == set(http_session.RETRY_STATUSES)
@@ -0,0 +1,20 @@
+import pandas as pd
+
+from src.ui_streamlit.date_labels import uk_date_labels
+
+
+def test_uk_date_labels_formats_iso_dates_in_one_pass() -> None:
+    labels = uk_date_labels(pd.Series(["2026-03-03", "2026-03-06"]))
+
+    assert labels.tolist() == ["Tue 03 Mar 2026", "Fri 06 Mar 2026"]
+
+
+def test_uk_date_labels_falls_back_when_no_value_is_plain_iso() -> None:
+    assert uk_date_labels(pd.Series(["03/03/2026"])).tolist() == ["Tue 03 Mar 2026"]
+    assert uk_date_labels(pd.Series(["", "x"])).tolist() == ["", "x"]
+
+
+def test_uk_date_labels_mixes_vectorized_and_fallback_values() -> None:
+    labels = uk_date_labels(pd.Series(["2026-03-03", "06/03/2026"], index=[5, 9]))
+
+    assert labels.to_dict() == {5: "Tue 03 Mar 2026", 9: "Fri 06 Mar 2026"}